@@ -390,14 +390,17 @@ class KeySignature(base.Music21Object):
         # non traditional key
         self._alteredPitches = None
 
-        # cache altered pitches
-        self._alteredPitchesCached = []
+        # cache altered pitches; None until first requested
+        self._alteredPitchesCached = None
+        # cache altered pitches indexed by step
+        self._alteredStepsCached = None
 
     #---------------------------------------------------------------------------
     def _attributesChanged(self):
-        '''Clear the altered pitches cache
+        '''Clear the altered pitches caches
         '''
-        self._alteredPitchesCached = []
+        self._alteredPitchesCached = None
+        self._alteredStepsCached = None
 
 
     def _strDescription(self):
@@ -476,7 +479,7 @@ class KeySignature(base.Music21Object):
 
 
     def _getAlteredPitches(self):
-        if self._alteredPitchesCached: # if list not empty
+        if self._alteredPitchesCached is not None: # may be an empty list
             #environLocal.printDebug(['using cached altered pitches'])
             return self._alteredPitchesCached
 
@@ -538,6 +541,48 @@ class KeySignature(base.Music21Object):
         >>> g = key.KeySignature(-8)
         >>> [str(p) for p in g.alteredPitches]
         ['B-', 'E-', 'A-', 'D-', 'G-', 'C-', 'F-', 'B--']
+
+        The list is cached, including when it is empty, until the 
+        KeySignature changes.
+
+        >>> h = key.KeySignature(0)
+        >>> h.alteredPitches
+        []
+        >>> h.alteredPitches is h.alteredPitches
+        True
+        >>> h.sharps = 1
+        >>> h.alteredPitches
+        [<music21.pitch.Pitch F#>]
+        ''')
+
+    def _getAlteredSteps(self):
+        if self._alteredStepsCached is None:
+            self._alteredStepsCached = pitch.alteredPitchesToStepDict(
+                                       self.alteredPitches)
+        # return a copy, so that changing it does not change the cache
+        return dict(self._alteredStepsCached)
+
+    alteredSteps = property(_getAlteredSteps, 
+        doc='''
+        Return a dictionary of the steps altered by this KeySignature, 
+        where each value is a tuple of accidental names for that step,
+        as made by :func:`~music21.pitch.alteredPitchesToStepDict`.
+        This is the form of altered pitches that
+        :meth:`~music21.pitch.Pitch.updateAccidentalDisplay` looks up
+        most quickly; it is cached until the KeySignature changes, and
+        a new dictionary is returned each time.
+
+        >>> a = key.KeySignature(3)
+        >>> sorted(a.alteredSteps.items())
+        [('C', ('sharp',)), ('F', ('sharp',)), ('G', ('sharp',))]
+        >>> a.alteredSteps['A'] = ('sharp',)
+        >>> 'A' in a.alteredSteps
+        False
+        >>> a.sharps = -1
+        >>> a.alteredSteps
+        {'B': ('flat',)}
+        >>> key.KeySignature(0).alteredSteps
+        {}
         ''')
 
     def accidentalByStep(self, step):
@@ -150,6 +150,8 @@ class LilypondConverter(object):
         self.variantColors = ['blue', 'red', 'purple', 'green', 'orange', 'yellow', 'grey']
         self.coloredVariants = False
         self.variantMode = False
+        # lilypond base names, keyed by (step, accidental name)
+        self._baseNameCache = {}
 
     def setupTools(self):
         if os.path.exists(environLocal['lilypondPath']):
@@ -1363,12 +1365,28 @@ class LilypondConverter(object):
         '''
         returns a string of the base name (including accidental)
         for a music21 pitch
-        '''
+
+        >>> lpc = lily.translate.LilypondConverter()
+        >>> lpc.baseNameFromPitch(pitch.Pitch('E-4'))
+        u'ees'
+        >>> lpc.baseNameFromPitch(pitch.Pitch('b'))
+        'b'
+        '''
+        # names are cached, as the same few are needed for every pitch
+        if pitch.accidental is None:
+            accidentalName = None
+        else:
+            accidentalName = pitch.accidental.name
+        cacheKey = (pitch.step, accidentalName)
+        try:
+            return self._baseNameCache[cacheKey]
+        except KeyError:
+            pass
 
         baseName = pitch.step.lower()
-        if pitch.accidental is not None:
-            if pitch.accidental.name in self.accidentalConvert:
-                baseName += self.accidentalConvert[pitch.accidental.name]
+        if accidentalName in self.accidentalConvert:
+            baseName += self.accidentalConvert[accidentalName]
+        self._baseNameCache[cacheKey] = baseName
         return baseName
 
 
@@ -42,9 +42,26 @@ STEPREF = {
            'B' : 11,
                }
 STEPNAMES = ['C','D','E','F','G','A','B']
+# the position of each step name within STEPNAMES
+STEP_TO_INDEX = dict([(s, i) for i, s in enumerate(STEPNAMES)])
+# characters that are taken as octave designations in pitch names
+_octaveDigits = frozenset('0123456789')
+# names with a single sharp or flat that simplifyEnharmonic() respells
+_simplifiableNames = frozenset(['E#', 'B#', 'C-', 'F-'])
+# steps whose unaltered pitches getEnharmonic() spells with the step below
+# (as B#, C##, and F##); all other steps use the step above
+_lowerEnharmonicSteps = frozenset(['C', 'D', 'G'])
 
 TWELFTH_ROOT_OF_TWO = 2.0 ** (1.0/12)
 
+# equal-tempered frequencies (A4 = 440hz) for integer pitch space values
+# from FREQ440_TABLE_MIN_PS up to (but not including) FREQ440_TABLE_MAX_PS;
+# used by Pitch.freq440 to avoid a floating-point power for common pitches
+FREQ440_TABLE_MIN_PS = -24
+FREQ440_TABLE_MAX_PS = 200
+_freq440Table = tuple([440.0 * (TWELFTH_ROOT_OF_TWO ** (ps - 69)) 
+                 for ps in range(FREQ440_TABLE_MIN_PS, FREQ440_TABLE_MAX_PS)])
+
 # how many significant digits to keep in pitch space resolution
 # where 1 is a half step. this means that 4 significant digits of cents will be kept
 PITCH_SPACE_SIG_DIGITS = 6
@@ -70,6 +87,50 @@ accidentalNameToModifier = {
     'one-and-a-half-flat':'-`',
 }
 
+accidentalNameToAlter = {
+    'natural' : 0.0,
+    'sharp' : 1.0,
+    'double-sharp': 2.0,
+    'triple-sharp': 3.0,
+    'quadruple-sharp': 4.0,
+    'flat': -1.0,
+    'double-flat': -2.0,
+    'triple-flat': -3.0,
+    'quadruple-flat': -4.0,
+    'half-sharp': 0.5,
+    'one-and-a-half-sharp': 1.5,
+    'half-flat': -0.5,
+    'one-and-a-half-flat': -1.5,
+}
+
+# every specifier accepted by Accidental.set(), mapped to an accidental name;
+# specifiers include names, modifiers, Lilypond abbreviations, alternative 
+# names, and numeric alters. String specifiers must be lower case.
+accidentalSpecifierToName = {}
+for _name, _specifiers in [
+    ('natural', ['n', 0]),
+    ('sharp', ['is', 1]),
+    ('double-sharp', ['isis', 2]),
+    ('flat', ['es', -1]),
+    ('double-flat', ['eses', -2]),
+    ('half-sharp', ['quarter-sharp', 'ih', 'semisharp', .5]),
+    ('one-and-a-half-sharp', ['three-quarter-sharp', 'three-quarters-sharp', 
+        'isih', 'sesquisharp', 1.5]),
+    ('half-flat', ['quarter-flat', 'eh', 'semiflat', -.5]),
+    ('one-and-a-half-flat', ['three-quarter-flat', 'three-quarters-flat', 
+        'eseh', 'sesquiflat', -1.5]),
+    ('triple-sharp', ['isisis', 3]),
+    ('quadruple-sharp', ['isisisis', 4]),
+    ('triple-flat', ['eseses', -3]),
+    ('quadruple-flat', ['eseseses', -4]),
+    ]:
+    accidentalSpecifierToName[_name] = _name
+    if accidentalNameToModifier[_name] != '': # the natural has no modifier
+        accidentalSpecifierToName[accidentalNameToModifier[_name]] = _name
+    for _specifier in _specifiers:
+        accidentalSpecifierToName[_specifier] = _name
+del _name, _specifiers, _specifier
+
 # sort modifiers by length, from longest to shortest
 accidentalModifiersSorted = []
 for i in (4,3,2,1):
@@ -120,63 +181,58 @@ def _convertPitchClassToStr(pc):
         
 
 
-def _convertPsToOct(ps):
-    '''Utility conversion; does not process internals.
-    Converts a midiNote number to an octave number.
-    Assume C4 middle C, so 60 returns 4
-    
-    
-    >>> [pitch._convertPsToOct(59), pitch._convertPsToOct(60), pitch._convertPsToOct(61)]
-    [3, 4, 4]
-    >>> [pitch._convertPsToOct(12), pitch._convertPsToOct(0), pitch._convertPsToOct(-12)]
-    [0, -1, -2]
-    >>> pitch._convertPsToOct(135)
-    10
-    '''
-    #environLocal.printDebug(['_convertPsToOct: input', ps])
-    return int(math.floor(ps / 12.)) - 1
-
-def _convertPsToStep(ps):
+def _convertPsToStepAndOctave(ps):
     '''Utility conversion; does not process internal representations. 
 
     Takes in a pitch space floating-point value or a MIDI note number (Assume C4 middle C, so 60 returns 4).
 
-    Returns a tuple of Step, an Accidental object, and a Microtone object or None.
-    
-    
-    >>> pitch._convertPsToStep(60)
-    ('C', <accidental natural>, (+0c), 0)
-    >>> pitch._convertPsToStep(66)
-    ('F', <accidental sharp>, (+0c), 0)
-    >>> pitch._convertPsToStep(67)
-    ('G', <accidental natural>, (+0c), 0)
-    >>> pitch._convertPsToStep(68)
-    ('G', <accidental sharp>, (+0c), 0)
-    >>> pitch._convertPsToStep(-2)
-    ('B', <accidental flat>, (+0c), 0)
-
-    >>> pitch._convertPsToStep(60.5)
-    ('C', <accidental half-sharp>, (+0c), 0)
-    >>> pitch._convertPsToStep(61.5)
-    ('C', <accidental one-and-a-half-sharp>, (+0c), 0)
-    >>> pitch._convertPsToStep(62)
-    ('D', <accidental natural>, (+0c), 0)
-    >>> pitch._convertPsToStep(62.5)
-    ('D', <accidental half-sharp>, (+0c), 0)
-    >>> pitch._convertPsToStep(135)
-    ('E', <accidental flat>, (+0c), 0)
-    >>> pitch._convertPsToStep(70)
-    ('B', <accidental flat>, (+0c), 0)
-    >>> pitch._convertPsToStep(70.5)
-    ('B', <accidental half-flat>, (+0c), 0)
+    Returns a tuple of Step, an Accidental object, a Microtone object, and
+    an octave number, already including any shift needed when the step
+    has been spelled into the next octave.
+
+
+    >>> pitch._convertPsToStepAndOctave(59)
+    ('B', <accidental natural>, (+0c), 3)
+    >>> pitch._convertPsToStepAndOctave(60)
+    ('C', <accidental natural>, (+0c), 4)
+    >>> pitch._convertPsToStepAndOctave(0)
+    ('C', <accidental natural>, (+0c), -1)
+    >>> pitch._convertPsToStepAndOctave(66)
+    ('F', <accidental sharp>, (+0c), 4)
+    >>> pitch._convertPsToStepAndOctave(67)
+    ('G', <accidental natural>, (+0c), 4)
+    >>> pitch._convertPsToStepAndOctave(68)
+    ('G', <accidental sharp>, (+0c), 4)
+    >>> pitch._convertPsToStepAndOctave(-2)
+    ('B', <accidental flat>, (+0c), -2)
+
+    >>> pitch._convertPsToStepAndOctave(60.5)
+    ('C', <accidental half-sharp>, (+0c), 4)
+    >>> pitch._convertPsToStepAndOctave(61.5)
+    ('C', <accidental one-and-a-half-sharp>, (+0c), 4)
+    >>> pitch._convertPsToStepAndOctave(62)
+    ('D', <accidental natural>, (+0c), 4)
+    >>> pitch._convertPsToStepAndOctave(62.5)
+    ('D', <accidental half-sharp>, (+0c), 4)
+    >>> pitch._convertPsToStepAndOctave(135)
+    ('E', <accidental flat>, (+0c), 10)
+    >>> pitch._convertPsToStepAndOctave(70)
+    ('B', <accidental flat>, (+0c), 4)
+    >>> pitch._convertPsToStepAndOctave(70.5)
+    ('B', <accidental half-flat>, (+0c), 4)
+    >>> pitch._convertPsToStepAndOctave(71.9)
+    ('C', <accidental natural>, (-10c), 5)
+    >>> pitch._convertPsToStepAndOctave(59.9999999)
+    ('C', <accidental natural>, (+0c), 4)
     '''
     # rounding here is essential
     ps = round(ps, PITCH_SPACE_SIG_DIGITS)
-    pcReal = ps % 12 
+    # get octave and pitch class at once
+    octave, pcReal = divmod(ps, 12) 
     # micro here will be between 0 and 1
     pc, micro = divmod(pcReal, 1)
 
-    #environLocal.printDebug(['_convertPsToStep(): post divmod',  'ps', repr(ps), 'pcReal', repr(pcReal), 'pc', repr(pc), 'micro', repr(micro)])
+    #environLocal.printDebug(['_convertPsToStepAndOctave(): post divmod',  'ps', repr(ps), 'pcReal', repr(pcReal), 'pc', repr(pc), 'micro', repr(micro)])
 
     # if close enough to a quarter tone
     if round(micro, 1) == 0.5:
@@ -205,7 +261,7 @@ def _convertPsToStep(ps):
 
     pc = int(pc)
 
-    #environLocal.printDebug(['_convertPsToStep(): post', 'alter', alter, 'micro', micro, 'pc', pc])
+    #environLocal.printDebug(['_convertPsToStepAndOctave(): post', 'alter', alter, 'micro', micro, 'pc', pc])
 
     octShift = 0
     # check for unnecessary enharmonics
@@ -245,7 +301,34 @@ def _convertPsToStep(ps):
     else:
         micro = Microtone(0)
 
-    return name, acc, micro, octShift
+    return name, acc, micro, int(octave) - 1 + octShift
+
+def _constrainMidiNumber(value):
+    '''
+    Utility conversion; given an integer MIDI note number, transpose it 
+    by octaves, if necessary, so that it fits in the MIDI range of 0 to 127.
+
+    >>> pitch._constrainMidiNumber(60)
+    60
+    >>> pitch._constrainMidiNumber(127)
+    127
+    >>> pitch._constrainMidiNumber(128)
+    116
+    >>> pitch._constrainMidiNumber(160)
+    124
+    >>> pitch._constrainMidiNumber(-10)
+    2
+    '''
+    # nearly all values are in range; test that first
+    if 0 <= value <= 127:
+        return value
+    elif value > 127:
+        value = (12 * 9) + (value % 12) # highest oct plus modulus
+        if value < (127-12):
+            value += 12
+        return value
+    else:
+        return value % 12 # lowest oct plus modulus
 
 def _convertCentsToAlterAndCents(shift):
     '''
@@ -331,6 +414,108 @@ def _convertHarmonicToCents(value):
     return int(round(1200*math.log(value, 2), 0))
 
 
+# cache of German names, keyed by (step, alter); see _convertStepAndAlterToGerman
+_germanNameCache = {}
+
+def _convertStepAndAlterToGerman(step, alter):
+    '''Given an upper-case step and an integer alter, return the name 
+    in the German system (where B-flat = B, B = H, etc.).
+    
+    Results are cached, as the domain of steps and alters is small 
+    and this is called for every access of Pitch.german.
+    
+    >>> pitch._convertStepAndAlterToGerman('E', -1)
+    'Es'
+    >>> pitch._convertStepAndAlterToGerman('B', -1)
+    'B'
+    >>> pitch._convertStepAndAlterToGerman('B', 0)
+    'H'
+    >>> pitch._convertStepAndAlterToGerman('A', -2)
+    'Ases'
+    >>> pitch._convertStepAndAlterToGerman('B', 1)
+    'His'
+    '''
+    try:
+        return _germanNameCache[(step, alter)]
+    except KeyError:
+        pass
+    tempStep = step
+    tempAlter = alter
+    if tempStep == 'B':
+        if tempAlter != -1:
+            tempStep = 'H'
+        else:
+            tempAlter += 1
+    if tempAlter == 0:
+        tempName = tempStep
+    elif tempAlter > 0:
+        tempName = tempStep + (tempAlter * 'is')
+    else: # flats
+        if tempStep in ['C','D','F','G','H']:
+            firstFlatName = 'es'
+        else: # A, E.  Bs should never occur...
+            firstFlatName = 's'
+        multipleFlats = abs(tempAlter) - 1
+        tempName =  tempStep + firstFlatName + (multipleFlats * 'es')
+    _germanNameCache[(step, alter)] = tempName
+    return tempName
+
+# Interval objects for getHigherEnharmonic() and getLowerEnharmonic(); 
+# created on first use rather than when this module is imported
+_enharmonicIntervalCache = {}
+
+def _getEnharmonicInterval(name):
+    '''
+    Return a shared Interval object for the interval `name` ('d2' or '-d2'),
+    creating it on first use. Interval.transposePitch() does not change 
+    the Interval, so one object can serve all calls.
+
+    
+    >>> pitch._getEnharmonicInterval('d2')
+    <music21.interval.Interval d2>
+    >>> pitch._getEnharmonicInterval('-d2') is pitch._getEnharmonicInterval('-d2')
+    True
+    '''
+    try:
+        return _enharmonicIntervalCache[name]
+    except KeyError:
+        intervalObj = interval.Interval(name)
+        _enharmonicIntervalCache[name] = intervalObj
+        return intervalObj
+
+def alteredPitchesToStepDict(alteredPitches):
+    '''
+    Given a list of altered Pitch objects, such as those provided by 
+    :attr:`~music21.key.KeySignature.alteredPitches`, return a dictionary 
+    of step names to tuples of accidental names. Passing this dictionary
+    as the `alteredPitches` of :meth:`~music21.pitch.Pitch.updateAccidentalDisplay`
+    replaces a search of the list with a single lookup, and lets many 
+    Pitches be updated without rebuilding it for each one.
+
+    
+    >>> from music21 import key
+    >>> d = pitch.alteredPitchesToStepDict(key.KeySignature(-2).alteredPitches)
+    >>> sorted(d.items())
+    [('B', ('flat',)), ('E', ('flat',))]
+    >>> d = pitch.alteredPitchesToStepDict(key.KeySignature(9).alteredPitches)
+    >>> d['F'], d['C'], d['G']
+    (('sharp', 'double-sharp'), ('sharp', 'double-sharp'), ('sharp',))
+
+    A Pitch without an Accidental marks its step as altered, but adds 
+    no accidental name.
+
+    >>> pitch.alteredPitchesToStepDict([pitch.Pitch('F'), pitch.Pitch('B-')])
+    {'B': ('flat',), 'F': ()}
+    '''
+    post = {}
+    for p in alteredPitches:
+        if p.accidental is None:
+            post[p.step] = post.get(p.step, ())
+        else:
+            post[p.step] = post.get(p.step, ()) + (p.accidental.name,)
+    return post
+
+
 
 
 #-------------------------------------------------------------------------------
@@ -480,6 +665,9 @@ class Microtone(object):
     def _getCents(self):
         '''Return the cents.
         '''
+        # the first harmonic is no shift; avoid the logarithm
+        if self._harmonicShift == 1:
+            return self._centShift
         return _convertHarmonicToCents(self._harmonicShift) + self._centShift
 
     cents = property(_getCents, 
@@ -576,12 +764,11 @@ class Accidental(base.Music21Object):
         False
 
         '''
-        if other is None or not isinstance(other, Accidental):
-            return False
-        if self.name == other.name: 
+        if other is self: # Pitches often share or compare one Accidental
             return True
-        else: 
+        if other is None or not isinstance(other, Accidental):
             return False
+        return self._name == other._name
 
     def __ne__(self, other):
         '''Inequality. Needed for pitch comparisons.
@@ -684,63 +871,11 @@ class Accidental(base.Music21Object):
         '''
         if common.isStr(name):
             name = name.lower() # sometimes args get capitalized
-        if name in ['natural', "n", 0]: 
-            self._name = 'natural'
-            self._alter = 0.0
-        elif name in ['sharp', accidentalNameToModifier['sharp'], "is", 1, 1.0]:
-            self._name = 'sharp'
-            self._alter = 1.0
-        elif name in ['double-sharp', accidentalNameToModifier['double-sharp'], 
-            "isis", 2]:
-            self._name = 'double-sharp'
-            self._alter = 2.0
-        elif name in ['flat', accidentalNameToModifier['flat'], "es", -1]:
-            self._name = 'flat'
-            self._alter = -1.0
-        elif name in ['double-flat', accidentalNameToModifier['double-flat'], 
-            "eses", -2]:
-            self._name = 'double-flat'
-            self._alter = -2.0
-        
-        elif name in ['half-sharp', accidentalNameToModifier['half-sharp'], 
-            'quarter-sharp', 'ih', 'semisharp', .5]:
-            self._name = 'half-sharp'
-            self._alter = 0.5
-        elif name in ['one-and-a-half-sharp', 
-            accidentalNameToModifier['one-and-a-half-sharp'],
-            'three-quarter-sharp', 'three-quarters-sharp', 'isih', 
-            'sesquisharp', 1.5]:
-            self._name = 'one-and-a-half-sharp'
-            self._alter = 1.5  
-        elif name in ['half-flat', accidentalNameToModifier['half-flat'], 
-            'quarter-flat', 'eh', 'semiflat', -.5]:
-            self._name = 'half-flat'
-            self._alter = -0.5
-        elif name in ['one-and-a-half-flat', 
-            accidentalNameToModifier['one-and-a-half-flat'],
-            'three-quarter-flat', 'three-quarters-flat', 'eseh', 
-            'sesquiflat', -1.5]:
-            self._name = 'one-and-a-half-flat'
-            self._alter = -1.5
-        elif name in ['triple-sharp', accidentalNameToModifier['triple-sharp'], 
-            'isisis', 3]:
-            self._name = 'triple-sharp'
-            self._alter = 3.0
-        elif name in ['quadruple-sharp', 
-            accidentalNameToModifier['quadruple-sharp'], 'isisisis', 4]:
-            self._name = 'quadruple-sharp'
-            self._alter = 4.0
-        elif name in ['triple-flat', accidentalNameToModifier['triple-flat'],
-            'eseses', -3]:
-            self._name = 'triple-flat'
-            self._alter = -3.0
-        elif name in ['quadruple-flat', 
-            accidentalNameToModifier['quadruple-flat'], 'eseseses', -4]:
-            self._name = 'quadruple-flat'
-            self._alter = -4.0
-        else:
+        try:
+            self._name = accidentalSpecifierToName[name]
+        except (KeyError, TypeError): # TypeError if name is not hashable
             raise AccidentalException('%s is not a supported accidental type' % name)
-
+        self._alter = accidentalNameToAlter[self._name]
         self._modifier = accidentalNameToModifier[self._name]
 
 
@@ -925,11 +1060,13 @@ class Accidental(base.Music21Object):
         >>> b.displayType
         'always'
         '''        
-        if other != None: # empty accidental attributes are None
-            for attr in ['displayType', 'displayStatus', 
-                        'displayStyle', 'displaySize', 'displayLocation']:
-                value = getattr(other, attr)
-                setattr(self, attr, value)
+        if other is not None: # empty accidental attributes are None
+            # values on other have already been validated by its properties
+            self._displayType = other._displayType
+            self._displayStatus = other._displayStatus
+            self.displayStyle = other.displayStyle
+            self.displaySize = other.displaySize
+            self.displayLocation = other.displayLocation
 
 
 #-------------------------------------------------------------------------------
@@ -1120,6 +1257,22 @@ class Pitch(base.Music21Object):
     # constants shared by all classes
     _twelfth_root_of_two = TWELFTH_ROOT_OF_TWO
 
+    # __slots__ cannot be used here (or in Accidental): Music21Object 
+    # instances always have a __dict__, so little memory is saved, and 
+    # both Music21Object.__deepcopy__ (which copies only what is in 
+    # __dict__) and the JSONFreezer (which treats slot descriptors as 
+    # class attributes) would silently drop slotted attributes.
+#    __slots__ = (
+#        '_accidental',
+#        '_microtone',
+#        '_octave',
+#        '_overridden_freq440',
+#        '_step',
+#        'defaultOctave',
+#        'fundamental',
+#        'implicitAccidental',
+#        )
+
     def __init__(self, name=None, **keywords):
         base.Music21Object.__init__(self, **keywords)
 
@@ -1221,17 +1374,28 @@ class Pitch(base.Music21Object):
         >>> d = pitch.Pitch('d-4')
         >>> b == d
         False
-        
+
+        Objects that have Pitch attributes, such as Notes, can be compared:
+
+        >>> b == note.Note('c#4')
+        True
         '''
-        if other is None:
-            return False
-        elif (hasattr(other, 'octave') == False or hasattr(other, 'step') == False or
-              hasattr(other, 'step') == False):
-            return False
-        elif (self.octave == other.octave and self.step == other.step and 
-            self.accidental == other.accidental and self.microtone == other.microtone):
+        if other is self:
             return True
-        else:
+        elif other is None:
+            return False
+        elif isinstance(other, Pitch):
+            # compare attributes directly; properties are not needed here
+            return (self._octave == other._octave and 
+                    self._step == other._step and 
+                    self._accidental == other._accidental and 
+                    self._microtone == other._microtone)
+        # objects that present Pitch attributes, such as Notes, can be compared
+        try:
+            return (self.octave == other.octave and self.step == other.step and 
+                    self.accidental == other.accidental and 
+                    self.microtone == other.microtone)
+        except AttributeError:
             return False
 
     def __ne__(self, other):
@@ -1246,10 +1410,7 @@ class Pitch(base.Music21Object):
         >>> a < b
         True
         '''
-        if self.ps < other.ps:
-            return True
-        else:
-            return False
+        return self.ps < other.ps
 
     def __le__(self, other):
         '''
@@ -1287,10 +1448,7 @@ class Pitch(base.Music21Object):
         >>> a > b
         False
         '''
-        if self.ps > other.ps:
-            return True
-        else:
-            return False
+        return self.ps > other.ps
 
     def __ge__(self, other):
         '''
@@ -1635,12 +1793,17 @@ class Pitch(base.Music21Object):
         >>> pitch.Pitch('c`4')._getPs()
         59.5
         '''
-        step = self._step.upper()
-        ps = float(((self.implicitOctave + 1) * 12) + STEPREF[step])
-        if self.accidental is not None:        
-            ps = ps + self.accidental.alter
-        if self.microtone is not None:
-            ps = ps + self.microtone.alter
+        # this is called for every comparison and sort, so access
+        # attributes directly rather than through properties; ._step is 
+        # always stored in upper case
+        octave = self._octave
+        if octave is None:
+            octave = self.defaultOctave
+        ps = float(((octave + 1) * 12) + STEPREF[self._step])
+        if self._accidental is not None:        
+            ps = ps + self._accidental.alter
+        if self._microtone is not None:
+            ps = ps + self._microtone.alter
         return ps        
     
     def _setPs(self, value):
@@ -1663,13 +1826,15 @@ class Pitch(base.Music21Object):
         C#~4(-10c)
         '''
         # can assign microtone here; will be either None or a Microtone object
-        self.step, acc, self._microtone, octShift = _convertPsToStep(value)
+        # the step, accidental, and octave returned are already valid, so
+        # they can be assigned directly without going through the properties
+        self._step, acc, self._microtone, self._octave = \
+            _convertPsToStepAndOctave(value)
         # replace a natural with a None
         if acc.name == 'natural':
-            self.accidental = None
+            self._accidental = None
         else:
-            self.accidental = acc
-        self.octave = _convertPsToOct(value) + octShift
+            self._accidental = acc
 
         # all ps settings must set implicit to True, as we do not know
         # what accidental this is
@@ -1753,16 +1918,7 @@ class Pitch(base.Music21Object):
         '''
         see docs below, under property midi
         '''
-        roundedPS = int(round(self.ps))
-        if roundedPS > 127:
-            value = (12 * 9) + (roundedPS % 12)
-            if value < (127-12):
-                value += 12
-        elif roundedPS < 0:
-            value = 0 + (roundedPS % 12)
-        else:
-            value = roundedPS
-        return value
+        return _constrainMidiNumber(int(round(self._getPs())))
 
     def getMidiPreCentShift(self):
         '''If pitch bend will be used to adjust MIDI values, the given pitch values for microtones should go to the nearest non-microtonal pitch value, not rounded up or down. This method is used in MIDI output generation.
@@ -1787,14 +1943,7 @@ class Pitch(base.Music21Object):
         midi values are constrained within the range of 0 to 127
         floating point values,
         '''
-        value = int(round(value))
-        if value > 127:
-            value = (12 * 9) + (value % 12) # highest oct plus modulus
-            if value < (127-12):
-                value += 12
-        elif value < 0:
-            value = 0 + (value % 12) # lowest oct plus modulus            
-        self._setPs(value)
+        self._setPs(_constrainMidiNumber(int(round(value))))
 
         # all midi settings must set implicit to True, as we do not know
         # what accidental this is
@@ -1881,8 +2030,9 @@ class Pitch(base.Music21Object):
         # extract any numbers that may be octave designations
         octFound = []
         octNot = []
+        octaveDigits = _octaveDigits # local name for the loop
         for char in usrStr:
-            if char in [str(x) for x in range(10)]:
+            if char in octaveDigits:
                 octFound.append(char)
             else:
                 octNot.append(char)
@@ -1891,16 +2041,15 @@ class Pitch(base.Music21Object):
         # we have nothing but pitch specification
         if len(usrStr) == 1 and usrStr in STEPREF:
             self._step = usrStr
-            self.accidental = None
+            self._accidental = None
         # assume everything following pitch is accidental specification
         elif len(usrStr) > 1 and usrStr[0] in STEPREF:
             self._step = usrStr[0]
-            self.accidental = Accidental(usrStr[1:])
+            self._accidental = Accidental(usrStr[1:])
         else:
             raise PitchException("Cannot make a name out of %s" % repr(usrStr))
         if octFound != '': 
-            octave = int(octFound)
-            self.octave = octave
+            self._octave = int(octFound)
 
         # when setting by name, we assume that the accidental intended
         self.implicitAccidental = False
@@ -1958,10 +2107,10 @@ class Pitch(base.Music21Object):
     def _getNameWithOctave(self):
         '''Returns pitch name with octave
         '''
-        if self.octave is None:
+        if self._octave is None:
             return self.name
         else:
-            return self.name + str(self.octave)
+            return self.name + str(self._octave)
 
     def _setNameWithOctave(self, value):
         '''
@@ -2136,10 +2285,10 @@ class Pitch(base.Music21Object):
 
 
     def _getStepWithOctave(self):
-        if self.octave is None:
-            return self.step
+        if self._octave is None:
+            return self._step
         else:
-            return self.step + str(self.octave)
+            return self._step + str(self._octave)
 
     def _getPitchClass(self):
         return int(round(self.ps % 12))
@@ -2161,7 +2310,7 @@ class Pitch(base.Music21Object):
         # permit the submission of strings, like A an dB
         value = _convertPitchClassToNumber(value)
         # get step and accidental w/o octave
-        self._step, self._accidental, self._microtone, unused_octShift = _convertPsToStep(value)  
+        self._step, self._accidental, self._microtone, unused_octave = _convertPsToStepAndOctave(value)  
 
         # do not know what accidental is
         self.implicitAccidental = True
@@ -2272,10 +2421,10 @@ class Pitch(base.Music21Object):
     ''')
 
     def _getImplicitOctave(self):
-        if self.octave is None: 
+        if self._octave is None: 
             return self.defaultOctave
         else: 
-            return self.octave
+            return self._octave
         
     implicitOctave = property(_getImplicitOctave, doc='''
     Returns the octave of the Pitch, or defaultOctave if 
@@ -2289,29 +2438,9 @@ class Pitch(base.Music21Object):
             tempAlter = self.accidental.alter
         else:
             tempAlter = 0
-        tempStep = self.step
         if tempAlter != int(tempAlter):
             raise PitchException(u'Es geht nicht "german" zu benutzen mit Microtönen.  Schade!')
-        else:
-            tempAlter = int(tempAlter)
-        if tempStep == 'B':
-            if tempAlter != -1:
-                tempStep = 'H'
-            else:
-                tempAlter += 1
-        if tempAlter == 0:
-            return tempStep
-        elif tempAlter > 0:
-            tempName = tempStep + (tempAlter * 'is')
-            return tempName
-        else: # flats
-            if tempStep in ['C','D','F','G','H']:
-                firstFlatName = 'es'
-            else: # A, E.  Bs should never occur...
-                firstFlatName = 's'
-            multipleFlats = abs(tempAlter) - 1
-            tempName =  tempStep + firstFlatName + (multipleFlats * 'es')
-            return tempName
+        return _convertStepAndAlterToGerman(self.step, int(tempAlter))
     
     german = property(_getGerman, 
         doc ='''
@@ -2645,12 +2774,26 @@ class Pitch(base.Music21Object):
         >>> a = pitch.Pitch('A4')
         >>> a.freq440
         440.0
+
+        Microtones, and pitches beyond the range of the lookup
+        table, are computed directly:
+
+        >>> a.microtone = 50
+        >>> a.freq440 == pitch.Pitch('A~4').freq440
+        True
+        >>> pitch.Pitch('C20').freq440 > pitch.Pitch('C19').freq440
+        True
         '''
         if self._overridden_freq440:
             return self._overridden_freq440
         else:
             # works off of .ps values and thus will capture microtones
-            A4offset = self.ps - 69
+            ps = self.ps
+            psInt = int(ps)
+            if (psInt == ps and 
+                FREQ440_TABLE_MIN_PS <= psInt < FREQ440_TABLE_MAX_PS):
+                return _freq440Table[psInt - FREQ440_TABLE_MIN_PS]
+            A4offset = ps - 69
             return 440.0 * (self._twelfth_root_of_two ** A4offset)
             
     def _setFreq440(self, value):
@@ -3014,6 +3157,80 @@ class Pitch(base.Music21Object):
 
 
     #---------------------------------------------------------------------------
+    def _fastClone(self):
+        '''
+        Return a copy of this Pitch without the overhead of copy.deepcopy(): 
+        only the attributes that define a Pitch (step, octave, Accidental,
+        Microtone, fundamental, and related settings) are copied, along
+        with the groups. As with copy.deepcopy(), the id is copied only if
+        it has been set, not if it is the default id of the original
+        object. Sites are not carried over to the copy.
+        
+        Subclasses of Pitch, which may define other attributes, are 
+        copied with copy.deepcopy().
+
+        
+        >>> p = pitch.Pitch('e-5')
+        >>> p.accidental.displayStatus = True
+        >>> p.microtone = 20
+        >>> p2 = p._fastClone()
+        >>> p2 is p
+        False
+        >>> p2
+        <music21.pitch.Pitch E-5(+20c)>
+        >>> p2.accidental is p.accidental
+        False
+        >>> p2.accidental.displayStatus
+        True
+        >>> p2.microtone is p.microtone
+        False
+        >>> p2.id == p.id
+        False
+        >>> p.id = 'soprano'
+        >>> p.groups.append('melody')
+        >>> p3 = p._fastClone()
+        >>> p3.id, p3.groups
+        ('soprano', ['melody'])
+        >>> p3.groups is p.groups
+        False
+
+        Accidentals with a name or alter set directly are copied as they are:
+
+        >>> p4 = pitch.Pitch('c#4')
+        >>> p4.accidental.name = 'sharp-ish'
+        >>> p4.accidental.alter = 0.8
+        >>> p5 = p4._fastClone()
+        >>> p5.accidental.name, p5.accidental.alter, p5.ps
+        ('sharp-ish', 0.8, 60.8)
+        '''
+        if self.__class__ is not Pitch:
+            return copy.deepcopy(self)
+        new = Pitch()
+        if self.id != id(self): # a default id is the id() of the object
+            new.id = self.id
+        new.groups = copy.deepcopy(self.groups)
+        new._step = self._step
+        new._octave = self._octave
+        new.defaultOctave = self.defaultOctave
+        new.implicitAccidental = self.implicitAccidental
+        new._overridden_freq440 = self._overridden_freq440
+        if self._accidental is not None:
+            # copy the state rather than re-parsing the name, as name, alter
+            # and modifier may each have been set to any value
+            newAccidental = Accidental()
+            newAccidental._name = self._accidental._name
+            newAccidental._alter = self._accidental._alter
+            newAccidental._modifier = self._accidental._modifier
+            newAccidental.inheritDisplay(self._accidental)
+            new._accidental = newAccidental
+        if self._microtone is not None:
+            new._microtone = copy.copy(self._microtone)
+        else:
+            new._microtone = None
+        if self.fundamental is not None:
+            new.fundamental = copy.deepcopy(self.fundamental)
+        return new
+
     def isEnharmonic(self, other):
         '''
         Return True if other is an enharmonic equivalent of self. 
@@ -3028,6 +3245,9 @@ class Pitch(base.Music21Object):
         True
         >>> p3.isEnharmonic(p1)
         False
+
+        To compare many pitches with each other at once, use 
+        :func:`~music21.pitch.pairwiseEnharmonic`.
         
         OMIT_FROM_DOCS
         >>> p4 = pitch.Pitch('B##3')
@@ -3036,9 +3256,7 @@ class Pitch(base.Music21Object):
         True
         '''
         # if pitch space are equal, these are enharmonics
-        if other.ps == self.ps:
-            return True
-        return False
+        return other.ps == self._getPs()
 
     def getHigherEnharmonic(self, inPlace=False):
         '''
@@ -3074,7 +3292,7 @@ class Pitch(base.Music21Object):
         AccidentalException: -5 is not a supported accidental type
         
         '''
-        intervalObj = interval.Interval('d2')
+        intervalObj = _getEnharmonicInterval('d2')
         octaveStored = self.octave # may be None
         if not inPlace:
             post = intervalObj.transposePitch(self, maxAccidental=None)
@@ -3107,7 +3325,7 @@ class Pitch(base.Music21Object):
         >>> print(p1)
         B##2
         '''
-        intervalObj = interval.Interval('-d2')
+        intervalObj = _getEnharmonicInterval('-d2')
         octaveStored = self.octave # may be None
         if not inPlace:
             post = intervalObj.transposePitch(self)
@@ -3181,11 +3399,12 @@ class Pitch(base.Music21Object):
         if inPlace:
             returnObj = self
         else:
-            returnObj = copy.deepcopy(self)
+            returnObj = self._fastClone()
 
         if returnObj.accidental != None:
-            if abs(returnObj.accidental.alter) < 2.0 and \
-                returnObj.name not in ('E#', 'B#', 'C-', 'F-'):
+            alter = returnObj.accidental.alter
+            if (-2.0 < alter < 2.0 and 
+                returnObj.name not in _simplifiableNames):
                 pass
             else:
                 # by reseting the pitch space value, we will get a simplyer
@@ -3196,16 +3415,17 @@ class Pitch(base.Music21Object):
                     returnObj.octave = None
 
         if mostCommon == True:
-            if returnObj.name == 'D#':
+            name = returnObj.name
+            if name == 'D#':
                 returnObj.step = 'E'
                 returnObj.accidental = Accidental('flat')
-            elif returnObj.name == 'A#':
+            elif name == 'A#':
                 returnObj.step = 'B'
                 returnObj.accidental = Accidental('flat')
-            elif returnObj.name == 'G-':
+            elif name == 'G-':
                 returnObj.step = 'F'
                 returnObj.accidental = Accidental('sharp')
-            elif returnObj.name == 'D-':
+            elif name == 'D-':
                 returnObj.step = 'C'
                 returnObj.accidental = Accidental('sharp')
         
@@ -3272,25 +3492,17 @@ class Pitch(base.Music21Object):
         if inPlace:
             post = self
         else:
-            post = copy.deepcopy(self)
-
-        if post.accidental != None:
-            if post.accidental.alter > 0:
-                # we have a sharp, need to get the equivalent flat
-                post.getHigherEnharmonic(inPlace=True)
-            elif post.accidental.alter < 0:
-                post.getLowerEnharmonic(inPlace=True)
-            else: # assume some direction, perhaps using a dictionary
-                if self.step in ['C','D','G']:               
-                    post.getLowerEnharmonic(inPlace=True)
-                else:
-                    post.getHigherEnharmonic(inPlace=True)
-
+            post = self._fastClone()
+
+        if post.accidental is not None and post.accidental.alter != 0:
+            # a sharp needs the equivalent flat, and a flat the sharp
+            higher = post.accidental.alter > 0
+        else: # no alteration: the direction depends on the step
+            higher = post._step not in _lowerEnharmonicSteps
+        if higher:
+            post.getHigherEnharmonic(inPlace=True)
         else:
-            if self.step in ['C','D','G']:               
-                post.getLowerEnharmonic(inPlace=True)
-            else:
-                post.getHigherEnharmonic(inPlace=True)
+            post.getLowerEnharmonic(inPlace=True)
 
         
         if inPlace:
@@ -3451,20 +3663,25 @@ class Pitch(base.Music21Object):
         >>> lowlowlowD.octave = -3
         >>> lowlowlowD.diatonicNoteNum
         -19
+        >>> lowlowlowD.diatonicNoteNum = -16
+        >>> lowlowlowD.step, lowlowlowD.octave
+        ('G', -3)
         '''
-        if ['C','D','E','F','G','A','B'].count(self.step.upper()):
-            noteNumber = ['C','D','E','F','G','A','B'].index(self.step.upper())
-            return (noteNumber + 1 + (7 * self.implicitOctave))
-        else:
-            raise PitchException("Could not find " + self.step + " in the index of notes") 
+        # ._step is always stored in upper case
+        try:
+            noteNumber = STEP_TO_INDEX[self._step]
+        except KeyError:
+            raise PitchException("Could not find " + self._step + " in the index of notes") 
+        octave = self._octave
+        if octave is None:
+            octave = self.defaultOctave
+        return (noteNumber + 1 + (7 * octave))
 
     def _setDiatonicNoteNum(self, newNum):
-        octave = int((newNum-1)/7)
-        noteNameNum = newNum - 1 - (7*octave)
-        pitchList = ['C','D','E','F','G','A','B']
-        noteName = pitchList[noteNameNum]
-        self.octave = octave
-        self.step = noteName
+        octave, noteNameNum = divmod(newNum - 1, 7)
+        # octave and step are known to be valid; set directly
+        self._octave = octave
+        self._step = STEPNAMES[noteNameNum]
         return self
 
     diatonicNoteNum = property(_getDiatonicNoteNum, _setDiatonicNoteNum,
@@ -3516,7 +3733,7 @@ class Pitch(base.Music21Object):
         C#-1
         '''
         #environLocal.printDebug(['Pitch.transpose()', value])
-        if hasattr(value, 'diatonic'): # its an Interval class with a DiatonicInterval class
+        if isinstance(value, interval.Interval):
             intervalObj = value
         else: # try to process
             intervalObj = interval.Interval(value)
@@ -3524,14 +3741,15 @@ class Pitch(base.Music21Object):
             return intervalObj.transposePitch(self)
         else:
             p = intervalObj.transposePitch(self)
-            # can setName with nameWithOctave to recreate all essential
-            # pitch attributes
-            # NOTE: in some cases this may not return exactly the proper config            
-            self._setName(p.name)
-            if self.octave is not None:
-                self._setOctave(p.octave)
-            # manually copy accidental object
-            self.accidental = p.accidental
+            # p is a new Pitch whose step, octave, and accidental are already
+            # valid, so they can be assigned directly rather than by
+            # parsing p.name; implicit octaves remain implicit
+            self._step = p._step
+            if self._octave is not None:
+                self._octave = p._octave
+            self._accidental = p._accidental
+            # as when setting by name, the accidental is now intended
+            self.implicitAccidental = False
             # set fundamental
             self.fundamental = p.fundamental
             return None
@@ -3564,23 +3782,39 @@ class Pitch(base.Music21Object):
         <music21.pitch.Pitch G#7>
         >>> pitch.Pitch('f#2').transposeBelowTarget(pitch.Pitch('f#8'), minimize=True)
         <music21.pitch.Pitch F#8>
+        
+        microtonal pitches are moved below the target as well
+        
+        >>> pitch.Pitch('c~8').transposeBelowTarget(pitch.Pitch('c4'))
+        <music21.pitch.Pitch C~3>
+
+        an octave apart with the same microtone counts as the same pitch
+
+        >>> p = pitch.Pitch('A##4')
+        >>> p.microtone = 13.33
+        >>> t = pitch.Pitch('A##3')
+        >>> t.microtone = 13.33
+        >>> p.transposeBelowTarget(t)
+        <music21.pitch.Pitch A##3(+13c)>
         '''
         # TODO: add inPlace as an option, default is True
         src = self
-        while True:
-            # ref 20, min 10, lower ref
-            # ref 5, min 10, do not lower
-            if src.ps - target.ps <= 0:
-                break
-            # lower one octave
-            src.octave -= 1
+        # ref 20, min 10, lower ref
+        # ref 5, min 10, do not lower
+        distance = src.ps - target.ps
+        if distance > 0:
+            # lower all but the last needed octave at once; the last step
+            # compares pitch space values, as microtones add float error
+            src.octave -= int(math.ceil(distance / 12.0)) - 1
+            while src.ps - target.ps > 0:
+                src.octave -= 1
 
         # case where self is below target and minimize is True
         if minimize:
-            while True:
-                if target.ps - src.ps < 12:
-                    break
-                else:
+            distance = target.ps - src.ps
+            if distance >= 12:
+                src.octave += int(distance // 12) - 1
+                while target.ps - src.ps >= 12:
                     src.octave += 1
 
 
@@ -3614,25 +3848,35 @@ class Pitch(base.Music21Object):
         <music21.pitch.Pitch D3>
         >>> pitch.Pitch('d0').transposeAboveTarget(pitch.Pitch('e2'), minimize=True)
         <music21.pitch.Pitch D3>
+        >>> pitch.Pitch('c`0').transposeAboveTarget(pitch.Pitch('c4'))
+        <music21.pitch.Pitch C`5>
+        >>> p = pitch.Pitch('D-4')
+        >>> p.microtone = 22
+        >>> t = pitch.Pitch('C#0')
+        >>> t.microtone = 22
+        >>> p.transposeAboveTarget(t, minimize=True)
+        <music21.pitch.Pitch D-1(+22c)>
 
         '''
         src = self
         # case where self is below target
-        while True:
-            # ref 20, max 10, do not raise ref
-            # ref 5, max 10, raise ref to above max
-            if src.ps - target.ps >= 0:
-                break
-            # raise one octave
-            src.octave += 1
+        # ref 20, max 10, do not raise ref
+        # ref 5, max 10, raise ref to above max
+        distance = target.ps - src.ps
+        if distance > 0:
+            # raise all but the last needed octave at once; the last step
+            # compares pitch space values, as microtones add float error
+            src.octave += int(math.ceil(distance / 12.0)) - 1
+            while src.ps - target.ps < 0:
+                src.octave += 1
 
         # case where self is above target and minimize is True
         if minimize:
-            while True:
-                if src.ps - target.ps < 12:
-                    break
-                else:
-                    src.octave -= 1 
+            distance = src.ps - target.ps
+            if distance >= 12:
+                src.octave -= int(distance // 12) - 1
+                while src.ps - target.ps >= 12:
+                    src.octave -= 1
 
 
         return src
@@ -3643,6 +3887,8 @@ class Pitch(base.Music21Object):
     def _nameInKeySignature(self, alteredPitches):
         '''Determine if this pitch is in the collection of supplied altered pitches, derived from a KeySignature object
 
+        The altered pitches may also be given as a dictionary made 
+        by :func:`~music21.pitch.alteredPitchesToStepDict`.
         
         >>> a = pitch.Pitch('c#')
         >>> b = pitch.Pitch('g#')
@@ -3651,10 +3897,28 @@ class Pitch(base.Music21Object):
         True
         >>> b._nameInKeySignature(ks.alteredPitches)
         False
+        >>> alteredSteps = pitch.alteredPitchesToStepDict(ks.alteredPitches)
+        >>> a._nameInKeySignature(alteredSteps)
+        True
+        >>> b._nameInKeySignature(alteredSteps)
+        False
+        
+        A Pitch without an accidental is never in the altered pitches.
+        
+        >>> pitch.Pitch('c')._nameInKeySignature(alteredSteps)
+        False
         ''' 
-        for p in alteredPitches: # all are altered tones, must have acc
+        if self._accidental is None: # all altered tones have an accidental
+            return False
+        if isinstance(alteredPitches, dict):
+            accidentalNames = alteredPitches.get(self._step)
+            if accidentalNames is None:
+                return False
+            return self._accidental.name in accidentalNames
+        for p in alteredPitches:
             if p.step == self.step: # A# to A or A# to A-, etc
-                if p.accidental.name == self.accidental.name:
+                if (p.accidental is not None and 
+                    p.accidental.name == self.accidental.name):
                     return True
         return False
 
@@ -3669,13 +3933,43 @@ class Pitch(base.Music21Object):
         True
         >>> b._stepInKeySignature(ks.alteredPitches)
         False
+        >>> alteredSteps = pitch.alteredPitchesToStepDict(ks.alteredPitches)
+        >>> a._stepInKeySignature(alteredSteps)
+        True
+        >>> b._stepInKeySignature(alteredSteps)
+        False
         ''' 
+        if isinstance(alteredPitches, dict):
+            return self._step in alteredPitches
         for p in alteredPitches: # all are altered tones, must have acc
             if p.step == self.step: # A# to A or A# to A-, etc
                 return True
         return False
 
 
+    def _displayAccidental(self):
+        '''
+        Set this Pitch's Accidental to be displayed. If there is no 
+        Accidental, a natural is created, set to be displayed, and 
+        then assigned. Used by :meth:`~music21.pitch.Pitch.updateAccidentalDisplay`.
+
+        >>> a = pitch.Pitch('a')
+        >>> a._displayAccidental()
+        >>> a.accidental, a.accidental.displayStatus
+        (<accidental natural>, True)
+        >>> b = pitch.Pitch('b-')
+        >>> b._displayAccidental()
+        >>> b.accidental, b.accidental.displayStatus
+        (<accidental flat>, True)
+        '''
+        accidental = self._accidental
+        if accidental is None:
+            accidental = Accidental('natural')
+            accidental.displayStatus = True
+            self._accidental = accidental
+        else:
+            accidental.displayStatus = True
+
     def updateAccidentalDisplay(self, pitchPast=None, pitchPastMeasure=None,
                                 alteredPitches=None,
             cautionaryPitchClass=True, cautionaryAll=False, 
@@ -3697,7 +3991,9 @@ class Pitch(base.Music21Object):
 
         The `alteredPitches` list supplies pitches from a :class:`~music21.key.KeySignature` object using the 
         :attr:`~music21.key.KeySignature.alteredPitches` property. If None, a new list
-        will be made.
+        will be made. When updating many pitches against the same altered pitches,
+        the dictionary returned by :func:`~music21.pitch.alteredPitchesToStepDict`
+        can be given instead, so that it is not rebuilt for every pitch.
 
         If `cautionaryPitchClass` is True, comparisons to past accidentals 
         are made regardless of register. That is, if a past sharp is found two 
@@ -3778,13 +4074,23 @@ class Pitch(base.Music21Object):
             else:
                 return # exit: nothing more to do
 
+        # look up altered pitches by step rather than searching the list
+        if isinstance(alteredPitches, dict):
+            alteredSteps = alteredPitches
+        else:
+            alteredSteps = alteredPitchesToStepDict(alteredPitches)
+        # neither the step nor the relation of the name to the key 
+        # signature changes below, so evaluate each only once
+        nameInKS = self._nameInKeySignature(alteredSteps)
+        stepInKS = self._stepInKeySignature(alteredSteps)
+
         ### no pitches in past...
         if len(pitchPastAll) == 0:
             # if we have no past, we always need to show the accidental, 
             # unless this accidental is in the alteredPitches list
             if (self.accidental != None 
             and self.accidental.displayStatus in [False, None]):
-                if not self._nameInKeySignature(alteredPitches):
+                if not nameInKS:
                     self.accidental.displayStatus = True
                 else:
                     self.accidental.displayStatus = False
@@ -3792,16 +4098,14 @@ class Pitch(base.Music21Object):
             # in case display set to True and in alteredPitches, makeFalse
             elif (self.accidental != None 
                   and self.accidental.displayStatus == True 
-                  and self._nameInKeySignature(alteredPitches)):
+                  and nameInKS):
                 self.accidental.displayStatus = False
 
             # if no accidental or natural but matches step in key sig
             # we need to show or add or an accidental
             elif ((self.accidental == None or self.accidental.name == 'natural')
-                  and self._stepInKeySignature(alteredPitches)):
-                if self.accidental == None:
-                    self.accidental = Accidental('natural')
-                self.accidental.displayStatus = True
+                  and stepInKS):
+                self._displayAccidental()
             return # do not search past
 
         #### pitches in past... first search if last pitch in measure
@@ -3811,9 +4115,7 @@ class Pitch(base.Music21Object):
             thisPPast = pitchPast[i]
             if thisPPast.step == self.step and thisPPast.octave == self.octave:
                 if thisPPast.name != self.name: # conflicting alters, need accidental and return
-                    if self.accidental is None:
-                        self.accidental = Accidental('natural')
-                    self.accidental.displayStatus = True
+                    self._displayAccidental()
                     return
                 else: #names are the same, skip this line of questioning
                     break
@@ -3827,21 +4129,13 @@ class Pitch(base.Music21Object):
             (self.accidental != None 
              and self.accidental.displayType in ['even-tied', 'always'])): 
             # show all no matter
-            if self.accidental == None:
-                self.accidental = Accidental('natural')
             # show all accidentals, even if past encountered
-            self.accidental.displayStatus = True
+            self._displayAccidental()
             return # do not search past
 
         # store if a match was found and display set from past pitches
         setFromPitchPast = False 
 
-        if cautionaryPitchClass is True: # warn no mater what octave; thus create new without oct
-            pSelf = Pitch(self.name)
-            pSelf.accidental = self.accidental
-        else:
-            pSelf = self
-
         #where does the line divide between in measure and out of measure
         outOfMeasureLength = len(pitchPastMeasure)
 
@@ -3854,60 +4148,77 @@ class Pitch(base.Music21Object):
         ## if so, set continuousRepeatsInMeasure to True
         ## else, set to False
         
+        ## find where the continuous stream of the same note leading up 
+        ## to this one starts: past pitches in the measure at or after 
+        ## this index are continuous repeats
+        nameWithOctave = self.nameWithOctave
+        repeatStart = len(pitchPastAll)
+        while (repeatStart > outOfMeasureLength and 
+            pitchPastAll[repeatStart - 1].nameWithOctave == nameWithOctave):
+            repeatStart -= 1
+
+        ## only past pitches of the same step (A and A#) are compared; 
+        ## the check for the first pitch out of the measure below does not 
+        ## depend on the past pitch, and has the same result as the checks 
+        ## after this loop if no past pitch of this step is found.
+        ## the indices are generated from the most recent pitch backwards 
+        ## as needed, as most searches end at the nearest pitch of this step
+        step = self.step
+        stepIndices = (i for i in reversed(range(len(pitchPastAll))) 
+                       if pitchPastAll[i].step == step)
+
         ## figure out if this pitch is in the measure (pPastInMeasure = True)
         ## or not.
-        for i in reversed(range(len(pitchPastAll))):            
+        for i in stepIndices:
+            # bind self's accidental once per iteration; every branch that 
+            # creates a natural leaves the loop
+            pSelfAccidental = self.accidental
             # is the past pitch in the measure or out of the measure?
             if i < outOfMeasureLength:
                 pPastInMeasure = False
                 continuousRepeatsInMeasure = False
             else:
                 pPastInMeasure = True
-                for j in range(i, len(pitchPastAll)):
-                    # do we have a continuous stream of the same note leading up to this one...
-                    if pitchPastAll[j].nameWithOctave != self.nameWithOctave:                    
-                        continuousRepeatsInMeasure = False
-                        break
-                else:
-                    continuousRepeatsInMeasure = True
+                continuousRepeatsInMeasure = (i >= repeatStart)
             # if the pitch is the first of a measure, has an accidental, 
             # it is not an altered key signature pitch, 
             # and it is not a natural, it should always be set to display
             if (pPastInMeasure == False
-                and self.accidental != None 
-                and not self._nameInKeySignature(alteredPitches)):
-                self.accidental.displayStatus = True
+                and pSelfAccidental is not None 
+                and not nameInKS):
+                pSelfAccidental.displayStatus = True
                 return # do not search past
              
-            # create Pitch objects for comparison; remove pitch space
-            # information if we are only doing a pitch class comparison
-            if cautionaryPitchClass == True: # no octave; create new without oct
-                pPast = Pitch(pitchPastAll[i].name)
-                # must manually assign reference to the same accidentals
-                # as name alone will not transfer display status
-                pPast.accidental = pitchPastAll[i].accidental
-            else: # cautionary in terms of pitch space; must match exact
-                pPast = pitchPastAll[i]
-
-            # if we do not match steps (A and A#), we can continue
-            if pPast.step != pSelf.step:
-                continue
+            pPast = pitchPastAll[i]
 
             # store whether these match at the same octave; needed for some
             # comparisons even if not matching pitchSpace
-            if self.octave == pitchPastAll[i].octave:
+            if self.octave == pPast.octave:
                 octaveMatch = True
             else:
                 octaveMatch = False
 
+            # find the state of both accidentals once, rather than in each
+            # of the conditions below; neither accidental changes until 
+            # one of the conditions is met
+            pPastAccidental = pPast.accidental
+            pastHasAccidental = pPastAccidental is not None
+            selfHasAccidental = pSelfAccidental is not None
+            pastIsNatural = (pastHasAccidental and 
+                             pPastAccidental.name == 'natural')
+            selfIsNatural = (selfHasAccidental and 
+                             pSelfAccidental.name == 'natural')
+            sameAccidental = (pastHasAccidental and selfHasAccidental and 
+                              pPastAccidental.name == pSelfAccidental.name)
+
             # repeats of the same pitch immediately following, in the same measure
             # where one previous pitch has displayStatus = True; don't display
             if (continuousRepeatsInMeasure == True
-                and pPast.accidental != None
-                and pPast.accidental.displayStatus == True
+                and pastHasAccidental
+                and pPastAccidental.displayStatus == True
                 ):
-                if pSelf.accidental != None: #only needed if one has a natural and this does not
-                    self.accidental.displayStatus = False
+                if selfHasAccidental: #only needed if one has a natural and this does not
+                    pSelfAccidental.displayStatus = False
                 return
 
             # repeats of the same accidentally immediately following
@@ -3915,105 +4226,88 @@ class Pitch(base.Music21Object):
             # regardless of if 'unless-repeated' is set, this will catch 
             # a repeated case
             
-            elif (continuousRepeatsInMeasure == True
-                and pPast.accidental != None 
-                and pSelf.accidental != None 
-                and pPast.accidental.name == pSelf.accidental.name):
+            elif continuousRepeatsInMeasure == True and sameAccidental:
 
                 ### BUG! what about C#4 C#5 C#4 C#5 -- last C#4 and C#5 should not show accidental if cautionaryNotImmediateRepeat is False
                                 
                 # if not in the same octave, and not in the key sig, do show accidental
-                if (self._nameInKeySignature(alteredPitches) == False
+                if (nameInKS == False
                     and (octaveMatch == False
-                         or pPast.accidental.displayStatus == False)
+                         or pPastAccidental.displayStatus == False)
                     ):
                     displayAccidentalIfNoPreviousAccidentals = True
                     continue
                 else:
-                    self.accidental.displayStatus = False
+                    pSelfAccidental.displayStatus = False
                     setFromPitchPast = True
                     break
 
             # if An to A: do not need another natural
             # yet, if we are against the key sig, then we need another natural if in another octave
-            elif (pPast.accidental != None 
-                  and pPast.accidental.name == 'natural' 
-                  and (pSelf.accidental == None 
-                       or pSelf.accidental.name == 'natural')):
+            elif pastIsNatural and (not selfHasAccidental or selfIsNatural):
                 if continuousRepeatsInMeasure == True: # an immediate repeat; do not show
                     # unless we are altering the key signature and in 
                     # a different register
-                    if (self._stepInKeySignature(alteredPitches) == True
+                    if (stepInKS == True
                         and octaveMatch == False):
-                        if self.accidental == None:
-                            self.accidental = Accidental('natural')
-                        self.accidental.displayStatus = True
+                        self._displayAccidental()
                     else:
-                        if self.accidental != None:
-                            self.accidental.displayStatus = False
+                        if selfHasAccidental:
+                            pSelfAccidental.displayStatus = False
                 # if we match the step in a key signature and we want 
                 # cautionary not immediate repeated
-                elif (self._stepInKeySignature(alteredPitches) == True
+                elif (stepInKS == True
                       and cautionaryNotImmediateRepeat == True):
-                    if self.accidental == None:
-                        self.accidental = Accidental('natural')
-                    self.accidental.displayStatus = True
+                    self._displayAccidental()
 
                 # cautionaryNotImmediateRepeat == False
                 # but the previous note was not in this measure,
                 # so do the previous step anyhow
-                elif (self._stepInKeySignature(alteredPitches) == True
+                elif (stepInKS == True
                       and cautionaryNotImmediateRepeat == False
                       and pPastInMeasure == False):
-                    if self.accidental == None:
-                        self.accidental = Accidental('natural')
-                    self.accidental.displayStatus = True
+                    self._displayAccidental()
 
                 
                 
                 # other cases: already natural in past usage, do not need 
                 # natural again (and not in key sig)
                 else:
-                    if self.accidental != None:
-                        self.accidental.displayStatus = False
+                    if selfHasAccidental:
+                        pSelfAccidental.displayStatus = False
                 setFromPitchPast = True
                 break
 
             # if A# to A, or A- to A, but not A# to A#
             # we use step and octave though not necessarily a ps comparison
-            elif (pPast.accidental != None 
-                  and pPast.accidental.name != 'natural' 
-                  and (pSelf.accidental == None 
-                       or pSelf.accidental.displayStatus == False)):
+            elif (pastHasAccidental and not pastIsNatural
+                  and (not selfHasAccidental 
+                       or pSelfAccidental.displayStatus == False)):
                 if octaveMatch == False and cautionaryPitchClass == False:
                     continue
-                if self.accidental == None:
-                    self.accidental = Accidental('natural')
-                self.accidental.displayStatus = True
+                self._displayAccidental()
                 setFromPitchPast = True
                 break
 
             # if An or A to A#: need to make sure display is set
-            elif ((pPast.accidental == None 
-                   or pPast.accidental.name == 'natural') 
-                  and pSelf.accidental != None 
-                  and pSelf.accidental.name != 'natural'):
-                self.accidental.displayStatus = True
+            elif ((not pastHasAccidental or pastIsNatural) 
+                  and selfHasAccidental and not selfIsNatural):
+                pSelfAccidental.displayStatus = True
                 setFromPitchPast = True
                 break
 
             # if A- or An to A#: need to make sure display is set
-            elif (pPast.accidental != None and pSelf.accidental != None 
-                  and pPast.accidental.name != pSelf.accidental.name):
-                self.accidental.displayStatus = True
+            elif (pastHasAccidental and selfHasAccidental 
+                  and not sameAccidental):
+                pSelfAccidental.displayStatus = True
                 setFromPitchPast = True
                 break
 
             # going from a natural to an accidental, we should already be
             # showing the accidental, but just to check
             # if A to A#, or A to A-, but not A# to A
-            elif (pPast.accidental == None and pSelf.accidental != None):
-                self.accidental.displayStatus = True
+            elif not pastHasAccidental and selfHasAccidental:
+                pSelfAccidental.displayStatus = True
                 #environLocal.printDebug(['match previous no mark'])
                 setFromPitchPast = True
                 break
@@ -4022,27 +4316,25 @@ class Pitch(base.Music21Object):
             # default is to show accidental
             # if cautionaryNotImmediateRepeat is False, will not be shown
             elif (continuousRepeatsInMeasure == False
-                  and pPast.accidental != None 
-                  and pSelf.accidental != None 
-                  and pPast.accidental.name == pSelf.accidental.name
+                  and sameAccidental
                   and octaveMatch == True):
                 if (cautionaryNotImmediateRepeat == False 
-                    and pPast.accidental.displayStatus != False): 
+                    and pPastAccidental.displayStatus != False): 
                     # do not show (unless previous note's accidental wasn't displayed
                     # because of a tie or some other reason)
                     # result will be False, do not need to check altered tones
-                    self.accidental.displayStatus = False
+                    pSelfAccidental.displayStatus = False
                     displayAccidentalIfNoPreviousAccidentals = False
                     setFromPitchPast = True
                     break
-                elif pPast.accidental.displayStatus == False:
+                elif pPastAccidental.displayStatus == False:
                     # in case of ties...
                     displayAccidentalIfNoPreviousAccidentals = True
                 else:
-                    if not self._nameInKeySignature(alteredPitches):
-                        self.accidental.displayStatus = True
+                    if not nameInKS:
+                        pSelfAccidental.displayStatus = True
                     else:
-                        self.accidental.displayStatus = False
+                        pSelfAccidental.displayStatus = False
                     setFromPitchPast = True
                     return
             
@@ -4055,24 +4347,21 @@ class Pitch(base.Music21Object):
         if displayAccidentalIfNoPreviousAccidentals == True:
             # not the first pitch of this nameWithOctave in the measure
             # but, because of ties, the first to be displayed
-            if self._nameInKeySignature(alteredPitches) == False:
-                if self.accidental is None:
-                    self.accidental = Accidental('natural')
-                self.accidental.displayStatus = True
+            if nameInKS == False:
+                self._displayAccidental()
             else:
                 self.accidental.displayStatus = False
             displayAccidentalIfNoPreviousAccidentals = False #just to be sure
         elif not setFromPitchPast and self.accidental != None:
-            if not self._nameInKeySignature(alteredPitches):
+            if not nameInKS:
                 self.accidental.displayStatus = True
             else:
                 self.accidental.displayStatus = False
 
         # if we have natural that alters the key sig, create a natural
         elif not setFromPitchPast and self.accidental == None:
-            if self._stepInKeySignature(alteredPitches):
-                self.accidental = Accidental('natural')
-                self.accidental.displayStatus = True
+            if stepInKS:
+                self._displayAccidental()
                 
     def getStringHarmonic(self, chordIn):
         '''
@@ -4142,6 +4431,147 @@ class Pitch(base.Music21Object):
         return chordOut
 
 
+#-------------------------------------------------------------------------------
+# processing many Pitch objects at once with numpy arrays
+
+def _getNumpy():
+    '''
+    Import and return numpy; raise a PitchException if it is not available.
+    This is done inside a function so that numpy is not imported 
+    unless it is actually needed.
+    '''
+    if 'numpy' in base._missingImport:
+        raise PitchException('could not find numpy, array processing of pitches is not allowed')
+    import numpy
+    return numpy
+
+
+def pitchesToArrays(pitches):
+    '''
+    Given a list of Pitch objects, return four parallel numpy arrays:
+    the index of each step in STEPNAMES (C = 0 through B = 6),
+    the octave of each Pitch (or the implicit octave, if no octave is set),
+    the alter of each Pitch's Accidental, and the alter of each Pitch's
+    Microtone (where 1 is one half step). The two alters are kept apart
+    so that pitch space values can be summed in the same order as
+    Pitch.ps, and so give identical floating-point results.
+
+    These arrays allow analytical passes over many pitches (such as 
+    computing pitch space values with 
+    :func:`~music21.pitch.arraysToPitchSpace`) to run as single 
+    vectorized operations rather than as one Python call per Pitch.
+
+    Requires numpy.
+    '''
+    numpy = _getNumpy()
+    count = len(pitches)
+    steps = numpy.fromiter((STEP_TO_INDEX[p._step] for p in pitches), 
+                           dtype=numpy.int8, count=count)
+    octaves = numpy.fromiter(((p._octave if p._octave is not None 
+                               else p.defaultOctave) for p in pitches), 
+                             dtype=numpy.int16, count=count)
+    accidentalAlters = numpy.fromiter(
+        ((p._accidental.alter if p._accidental is not None else 0.0)
+         for p in pitches), dtype=numpy.float64, count=count)
+    microtoneAlters = numpy.fromiter(
+        ((p._microtone.alter if p._microtone is not None else 0.0)
+         for p in pitches), dtype=numpy.float64, count=count)
+    return steps, octaves, accidentalAlters, microtoneAlters
+
+
+def arraysToPitchSpace(steps, octaves, accidentalAlters, microtoneAlters):
+    '''
+    Given parallel arrays of step indices, octaves, accidental alters,
+    and microtone alters, as returned by
+    :func:`~music21.pitch.pitchesToArrays`, return a numpy array of
+    pitch space values, as found on Pitch.ps, computed in one
+    vectorized expression.
+
+    Requires numpy.
+    '''
+    numpy = _getNumpy()
+    stepPs = numpy.array([STEPREF[s] for s in STEPNAMES], dtype=numpy.float64)
+    # add the alters one at a time, as Pitch.ps does
+    stepOctavePs = stepPs[steps] + 12 * (
+        numpy.asarray(octaves, dtype=numpy.float64) + 1)
+    return (stepOctavePs + accidentalAlters) + microtoneAlters
+
+
+def pitchesToPitchSpace(pitches):
+    '''
+    Given a list of Pitch objects, return a numpy array of their pitch 
+    space values, as found on Pitch.ps. 
+    
+    The attributes of all Pitches are gathered in one pass with 
+    :func:`~music21.pitch.pitchesToArrays` and then combined with 
+    :func:`~music21.pitch.arraysToPitchSpace`, so that comparing or 
+    sorting many pitches by pitch space does not need one Pitch.ps 
+    call per Pitch.
+
+    Requires numpy.
+    '''
+    return arraysToPitchSpace(*pitchesToArrays(pitches))
+
+
+def pairwiseEnharmonic(pitchesA, pitchesB):
+    '''
+    Given two lists of Pitch objects, return a two-dimensional numpy 
+    array of booleans, where the value at [i, j] is True if pitchesA[i] 
+    is an enharmonic equivalent of pitchesB[j], as determined by
+    :meth:`~music21.pitch.Pitch.isEnharmonic`.
+    
+    All comparisons are made in one vectorized operation, rather than 
+    with one Pitch.isEnharmonic call for every pair of Pitches.
+
+    Requires numpy.
+    '''
+    numpy = _getNumpy()
+    return numpy.equal.outer(pitchesToPitchSpace(pitchesA), 
+                             pitchesToPitchSpace(pitchesB))
+
+
+def arraysToPitches(steps, octaves, accidentalAlters, microtoneAlters):
+    '''
+    The inverse of :func:`~music21.pitch.pitchesToArrays`: given parallel
+    arrays of step indices, octaves, accidental alters, and microtone
+    alters, return a list of new Pitch objects.
+
+    All returned Pitches have explicit octaves. An accidental alter of
+    zero produces a Pitch without an Accidental, and a microtone alter
+    of zero leaves the Pitch with its default Microtone of zero cents.
+
+    The arrays do not store accidental names. An alter that no named
+    Accidental has, as when Accidental.alter has been set directly, 
+    is kept as it is, and its Accidental takes the name and modifier of 
+    the Accidental with the nearest alter.
+
+    Requires numpy.
+    '''
+    post = []
+    for s, o, a, m in zip(steps, octaves, accidentalAlters, microtoneAlters):
+        p = Pitch()
+        p._step = STEPNAMES[s]
+        p._octave = int(o)
+        if a != 0:
+            a = float(a)
+            if a in accidentalSpecifierToName:
+                p._accidental = Accidental(a)
+            else:
+                name = min(accidentalNameToAlter, 
+                           key=lambda n: (abs(accidentalNameToAlter[n] - a), n))
+                accidentalObj = Accidental()
+                accidentalObj._name = name
+                accidentalObj._alter = a
+                accidentalObj._modifier = accidentalNameToModifier[name]
+                p._accidental = accidentalObj
+        if m != 0:
+            # remove float error from the conversion back to cents
+            p._microtone = Microtone(round(m * 100.0,
+                                           PITCH_SPACE_SIG_DIGITS))
+        post.append(p)
+    return post
+
+
 #-------------------------------------------------------------------------------
 class TestExternal(unittest.TestCase):
     
@@ -4163,12 +4593,9 @@ class Test(unittest.TestCase):
         '''Test copying all objects defined in this module
         '''
         import sys, types
+        skip = ('_', 'Test', 'Exception') # '__' is matched by '_'
         for part in sys.modules[self.__module__].__dict__:
-            match = False
-            for skip in ['_', '__', 'Test', 'Exception']:
-                if part.startswith(skip) or part.endswith(skip):
-                    match = True
-            if match:
+            if part.startswith(skip) or part.endswith(skip):
                 continue
             name = getattr(sys.modules[self.__module__], part)
             if callable(name) and not isinstance(name, types.FunctionType):
@@ -4206,6 +4633,22 @@ class Test(unittest.TestCase):
         self.assertEqual(pAltered.accidental.name, 'sharp')
         self.assertEqual(pAltered.accidental.displayStatus, True)
 
+    def testAccidentalSet(self):
+        for specifier, name in [('sharp', 'sharp'), ('#', 'sharp'),
+            ('IS', 'sharp'), (1, 'sharp'), (1.0, 'sharp'), ('eseh',
+            'one-and-a-half-flat'), (-1.5, 'one-and-a-half-flat'),
+            ('~', 'half-sharp'), (0, 'natural'), ('N', 'natural')]:
+            a = Accidental(specifier)
+            self.assertEqual(a.name, name)
+            self.assertEqual(a.alter, accidentalNameToAlter[name])
+            self.assertEqual(a.modifier, accidentalNameToModifier[name])
+        a = Accidental('flat')
+        self.assertRaises(AccidentalException, a.set, 'fred')
+        self.assertRaises(AccidentalException, a.set, '')
+        self.assertRaises(AccidentalException, a.set, 0.25)
+        self.assertRaises(AccidentalException, a.set, ['sharp'])
+        self.assertEqual(a.name, 'flat')
+
 
     def testUpdateAccidentalDisplaySimple(self):
         '''Test updating accidental display.
@@ -4227,6 +4670,30 @@ class Test(unittest.TestCase):
         self.assertEqual(b.accidental.displayStatus, True)
         self.assertEqual(b.accidental.name, 'natural')
 
+    def testUpdateAccidentalDisplayAlteredPitchWithoutAccidental(self):
+        '''An altered pitch without an Accidental marks only its step.
+        '''
+        alteredPitches = [Pitch('F')]
+        for altered in [alteredPitches,
+                        alteredPitchesToStepDict(alteredPitches)]:
+            a = Pitch('g4')
+            a.updateAccidentalDisplay([], alteredPitches=altered)
+            self.assertEqual(a.accidental, None)
+
+            b = Pitch('f4')
+            b.updateAccidentalDisplay([], alteredPitches=altered)
+            self.assertEqual(b.accidental.name, 'natural')
+            self.assertEqual(b.accidental.displayStatus, True)
+
+            past = [Pitch('f#4')]
+            c = Pitch('f4')
+            c.updateAccidentalDisplay(past, alteredPitches=altered)
+            self.assertEqual(c.accidental.name, 'natural')
+            self.assertEqual(c.accidental.displayStatus, True)
+
+            self.assertEqual(Pitch('f#4')._nameInKeySignature(altered), False)
+            self.assertEqual(Pitch('f#4')._stepInKeySignature(altered), True)
+
 
     def testUpdateAccidentalDisplaySeries(self):
         '''Test updating accidental display.
@@ -4386,15 +4853,6 @@ class Test(unittest.TestCase):
         proc(pList, [], ks.alteredPitches)        
         compare(pList, result)
 
-        # non initial scale tones with chromatic alteration
-        pList = [Pitch('a3'), Pitch('c#3'), Pitch('g#3'), 
-        Pitch('g3'), Pitch('c#4'), Pitch('g#4')]
-        result = [(None, None), ('sharp', False), ('sharp', False), 
-            ('natural', True), ('sharp', False), ('sharp', True)]
-        ks = key.KeySignature(3) 
-        proc(pList, [], ks.alteredPitches)        
-        compare(pList, result)
-
         # initial scale tones with chromatic alteration, repeated tones
         pList = [Pitch('f#3'), Pitch('f3'), Pitch('f#3'), 
                  Pitch('g3'), Pitch('f#4'), Pitch('f#4')]
@@ -4528,10 +4986,13 @@ class Test(unittest.TestCase):
                 ('a#', 'b-', False), ('a#', 'a-', False), ('a##', 'a#', False),
             ('a#4', 'a#4', True), ('a-3', 'a-4', False), ('a#3', 'a#4', False),
             ]
+        pitches = {} # comparison does not change a Pitch, so reuse them
         for x, y, match in data:
-            p1 = Pitch(x)
-            p2 = Pitch(y)
-            self.assertEqual(p1==p2, match)
+            for name in (x, y):
+                if name not in pitches:
+                    pitches[name] = Pitch(name)
+            self.assertEqual(pitches[x] == pitches[y], match, 
+                             '%s == %s should be %s' % (x, y, match))
 
         # specific case of changing octave
         p1 = Pitch('a#')
@@ -4637,8 +5098,6 @@ class Test(unittest.TestCase):
 
         self.assertEqual(pitch.Pitch('g4').harmonicString('c3'), '3rdH(-2c)/C3')
 
-        #self.assertEqual(str(_convertPsToStep(60.0)), "('C', <accidental natural>, None, 0)")
-
         self.assertEqual(str(pitch.Pitch('c4').getHarmonic(1)), 'C4')
         self.assertEqual(str(pitch.Pitch('c3').getHarmonic(2)), 'C4')
         self.assertEqual(str(pitch.Pitch('c2').getHarmonic(2)), 'C3')
@@ -4696,6 +5155,69 @@ class Test(unittest.TestCase):
             pList.append(str(p))
         self.assertEqual(str(pList), "['A4', 'A~4(+21c)', 'B`4(-11c)', 'B4(+4c)', 'B~4(+17c)', 'C~5(-22c)', 'C#5(-14c)', 'C#~5(-7c)', 'C##5(-2c)', 'D~5(+1c)', 'E-5(+3c)', 'E`5(+3c)', 'E5(+2c)', 'E~5(-1c)', 'F5(-4c)', 'F~5(-9c)', 'F#5(-16c)', 'F#~5(-23c)', 'F#~5(+19c)', 'G5(+10c)', 'G~5(-1c)', 'G#5(-12c)', 'G#~5(-24c)', 'G#~5(+14c)']")
 
+    def testPitchArrays(self):
+        if 'numpy' in base._missingImport:
+            return
+        pList = [Pitch('C4'), Pitch('F#5'), Pitch('B-'), Pitch('E`2'), 
+                 Pitch('D--7')]
+        pList[0].microtone = 20
+        arrays = pitchesToArrays(pList)
+        steps, octaves, accidentalAlters, microtoneAlters = arrays
+        self.assertEqual(steps.tolist(), [0, 3, 6, 2, 1])
+        self.assertEqual(octaves.tolist(), [4, 5, 4, 2, 7])
+        self.assertEqual(accidentalAlters.tolist(), [0, 1.0, -1.0, -0.5, -2.0])
+        self.assertEqual(microtoneAlters.tolist(), [0.2, 0, 0, 0, 0])
+
+        psList = arraysToPitchSpace(*arrays).tolist()
+        self.assertEqual(psList, [p.ps for p in pList])
+        self.assertEqual(pitchesToPitchSpace(pList).tolist(), psList)
+        self.assertEqual(pitchesToPitchSpace([]).tolist(), [])
+
+        pListB = [Pitch('B#3'), Pitch('G-5'), Pitch('D-4'), Pitch('A#4')]
+        match = pairwiseEnharmonic(pList, pListB)
+        self.assertEqual(match.shape, (5, 4))
+        self.assertEqual(match.tolist(), 
+            [[p.isEnharmonic(q) for q in pListB] for p in pList])
+        self.assertEqual(match[1].tolist(), [False, True, False, False])
+        self.assertEqual(match[2].tolist(), [False, False, False, True])
+
+        post = arraysToPitches(*arrays)
+        self.assertEqual([str(p) for p in post], 
+                         ['C4(+20c)', 'F#5', 'B-4', 'E`2', 'D--7'])
+        # the only difference is the explicit octave of the B-
+        self.assertEqual(post, pList[:2] + [Pitch('B-4')] + pList[3:])
+        self.assertEqual(post[0].accidental, None)
+        self.assertEqual([p.ps for p in post], psList)
+
+        # summing the alters in a different order than Pitch.ps can
+        # change the last bit of non-integer microtonal pitch space values
+        pList = [Pitch('F-1'), Pitch('C5'), Pitch('G#~3')]
+        for p, cents in zip(pList, [21.598, -30, 13.33]):
+            p.microtone = cents
+        arrays = pitchesToArrays(pList)
+        self.assertEqual(arraysToPitchSpace(*arrays).tolist(),
+                         [p.ps for p in pList])
+        self.assertEqual(arraysToPitches(*arrays), pList)
+
+        # alters set directly on an Accidental are kept
+        pListC = [Pitch('C#4'), Pitch('E-2')]
+        pListC[0].accidental.alter = 0.8
+        pListC[1].accidental.alter = -1.2
+        pListC[1].microtone = 10
+        post = arraysToPitches(*pitchesToArrays(pListC))
+        self.assertEqual(post, pListC)
+        self.assertEqual([p.accidental.alter for p in post], [0.8, -1.2])
+        self.assertEqual([p.accidental.modifier for p in post], ['#', '-'])
+        self.assertEqual([p.ps for p in post], [p.ps for p in pListC])
+
+        pListB = [Pitch('E1'), Pitch('C5'), Pitch('A`3')]
+        for p, cents in zip(pListB, [21.598, -30, 13.33]):
+            p.microtone = cents
+        self.assertEqual(pairwiseEnharmonic(pList, pListB).tolist(), 
+            [[True, False, False], [False, True, False], [False, False, True]])
+        self.assertEqual(pairwiseEnharmonic(pList, pListB).tolist(), 
+            [[p.isEnharmonic(q) for q in pListB] for p in pList])
+
         
 #-------------------------------------------------------------------------------
 # define presented order in documentation
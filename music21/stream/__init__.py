@@ -41,6 +41,7 @@ from music21 import key
 from music21 import metadata
 from music21 import meter
 from music21 import note
+from music21 import pitch
 from music21 import spanner
 from music21 import tie
 from music21 import repeat
@@ -5454,8 +5455,9 @@ class Stream(base.Music21Object):
         if alteredPitches is None:
             alteredPitches = []
         addAlteredPitches = []
+        ksFound = None
         if isinstance(useKeySignature, key.KeySignature):
-            addAlteredPitches = useKeySignature.alteredPitches
+            ksFound = useKeySignature
         elif useKeySignature is True: # get from defined contexts
             # will search local, then activeSite
             ksStream = self.getKeySignatures(
@@ -5463,8 +5465,17 @@ class Stream(base.Music21Object):
             if len(ksStream) > 0:
                 # assume we want the first found; in some cases it is possible
                 # that this may not be true
-                addAlteredPitches = ksStream[0].alteredPitches
-        alteredPitches += addAlteredPitches
+                ksFound = ksStream[0]
+        if ksFound is not None:
+            addAlteredPitches = ksFound.alteredPitches
+        # index altered pitches by step once for all notes, rather than 
+        # once for every call to updateAccidentalDisplay(); if only the 
+        # key signature supplies them, use its cached index
+        if ksFound is not None and len(alteredPitches) == 0:
+            alteredSteps = ksFound.alteredSteps
+        else:
+            alteredSteps = pitch.alteredPitchesToStepDict(
+                           alteredPitches + addAlteredPitches)
         #environLocal.printDebug(['processing makeAccidentals() with alteredPitches:', alteredPitches])
 
         # need to move through notes in order
@@ -5481,7 +5492,7 @@ class Stream(base.Music21Object):
             if isinstance(e, note.Note):
                 e.pitch.updateAccidentalDisplay(pitchPast=pitchPast,
                     pitchPastMeasure=pitchPastMeasure,
-                    alteredPitches=alteredPitches,
+                    alteredPitches=alteredSteps,
                     cautionaryPitchClass=cautionaryPitchClass,
                     cautionaryAll=cautionaryAll,
                     overrideStatus=overrideStatus,
@@ -5500,7 +5511,7 @@ class Stream(base.Music21Object):
                 for p in pGroup:
                     p.updateAccidentalDisplay(pitchPast=pitchPast,
                         pitchPastMeasure=pitchPastMeasure,
-                        alteredPitches=alteredPitches,
+                        alteredPitches=alteredSteps,
                         cautionaryPitchClass=cautionaryPitchClass, cautionaryAll=cautionaryAll,
                         overrideStatus=overrideStatus,
                       cautionaryNotImmediateRepeat=cautionaryNotImmediateRepeat,
@@ -82,10 +82,10 @@ class StreamStatus(object):
         other than None, this method returns True, regardless of if
         makeAccidentals has actually been run.
         '''
-        for p in self.client.pitches:
-            if p.accidental is not None:
-                if p.accidental.displayStatus is not None:
-                    return True
+        for p in self._client.pitches:
+            accidental = p.accidental
+            if accidental is not None and accidental.displayStatus is not None:
+                return True
         return False
 
     def haveBeamsBeenMade(self):
@@ -95,8 +95,11 @@ class StreamStatus(object):
         exist, this method returns True, regardless of if makeBeams has
         actually been run.
         '''
-        for n in self.client.flat.notes:
-            if n.beams is not None and len(n.beams.beamsList):
+        # walk contained elements rather than building a flat Stream
+        for n in self._client._yieldElementsDownward(
+            restoreActiveSites=False, classFilter=['NotRest']):
+            beams = n.beams
+            if beams is not None and len(beams.beamsList):
                 return True
         return False
 
@@ -2331,6 +2331,34 @@ class Test(unittest.TestCase):
         for n in s.notes:
             self.assertEqual(n.accidental.displayStatus, False)
 
+    def testMakeAccidentalsAlteredPitchesKeyChange(self):
+        '''
+        the key signature of one measure does not carry over to the next
+        through a supplied list of altered pitches, and that list is
+        not changed
+        '''
+        p1 = Part()
+        m1 = Measure()
+        m1.keySignature = key.KeySignature(2)
+        for n in ['D4', 'A4', 'B4']:
+            m1.append(note.Note(n))
+        m2 = Measure()
+        m2.keySignature = key.KeySignature(0)
+        for n in ['F4', 'C5', 'B4']:
+            m2.append(note.Note(n))
+        p1.append([m1, m2])
+
+        alteredPitches = [pitch.Pitch('B-')]
+        p1.makeAccidentals(alteredPitches=alteredPitches, inPlace=True)
+        self.assertEqual(alteredPitches, [pitch.Pitch('B-')])
+        # only the B contradicts the supplied B-; F and C are not in the
+        # key signature of the second measure
+        for m in [m1, m2]:
+            match = [n.pitch.accidental for n in m.notes]
+            self.assertEqual(match[:2], [None, None])
+            self.assertEqual(match[2].name, 'natural')
+            self.assertEqual(match[2].displayStatus, True)
+
 
 
     def testScaleOffsetsBasic(self):